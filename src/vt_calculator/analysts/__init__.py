@@ -7,7 +7,8 @@ from .analyst import (
     LLaVANextAnalyst,
     LlavaOnevisionAnalyst,
 )
-from transformers import AutoProcessor, AutoConfig
+from functools import lru_cache
+
 from typing import Callable, Dict, Tuple
 
 
@@ -43,34 +44,42 @@ def map_model_id(model_name: str) -> str:
     return MODEL_TO_HF_ID[key]
 
 
+# Analyst builders receive (processor, config) and must return an instance
+# of a VLMAnalyst subclass. The config argument may be ignored when not
+# needed by the analyst.
+ANALYST_REGISTRY: Dict[str, Tuple[Callable, bool]] = {
+    "qwen2.5-vl": (lambda proc, cfg: Qwen2_5_VLAnalyst(proc), False),
+    "qwen2-vl": (lambda proc, cfg: Qwen2VLAnalyst(proc), False),
+    "qwen3-vl": (lambda proc, cfg: Qwen3VLAnalyst(proc), False),
+    "internvl3": (lambda proc, cfg: InternVLAnalyst(proc, cfg), True),
+    "llava": (lambda proc, cfg: LLaVAAnalyst(proc), False),
+    "llava-next": (lambda proc, cfg: LLaVANextAnalyst(proc), False),
+    "llava-onevision": (lambda proc, cfg: LlavaOnevisionAnalyst(proc, cfg), True),
+}
+
+
+@lru_cache(maxsize=8)
 def load_analyst(model_name: str = DEFAULT_MODEL):
     """Factory that builds the correct analyst for a given short model name.
 
-    Selection is handled via a small registry mapping so it is easy to extend
-    with additional models without modifying conditional logic.
+    Selection is handled via the module-level registry mapping so it is easy
+    to extend with additional models without modifying conditional logic.
+    Results are memoized per model name, so repeat calls reuse the already
+    loaded processor/config instead of hitting the Hugging Face cache again.
     """
     model_id = map_model_id(model_name)
 
     key = model_name.strip().lower()
 
-    # Analyst builders receive (processor, config) and must return an instance
-    # of a VLMAnalyst subclass. The config argument may be ignored when not
-    # needed by the analyst.
-    ANALYST_REGISTRY: Dict[str, Tuple[Callable, bool]] = {
-        "qwen2.5-vl": (lambda proc, cfg: Qwen2_5_VLAnalyst(proc), False),
-        "qwen2-vl": (lambda proc, cfg: Qwen2VLAnalyst(proc), False),
-        "qwen3-vl": (lambda proc, cfg: Qwen3VLAnalyst(proc), False),
-        "internvl3": (lambda proc, cfg: InternVLAnalyst(proc, cfg), True),
-        "llava": (lambda proc, cfg: LLaVAAnalyst(proc), False),
-        "llava-next": (lambda proc, cfg: LLaVANextAnalyst(proc), False),
-        "llava-onevision": (lambda proc, cfg: LlavaOnevisionAnalyst(proc, cfg), True),
-    }
-
     if key not in ANALYST_REGISTRY:
         raise ValueError(f"No analyst registered for model: {model_name}")
 
     builder, needs_config = ANALYST_REGISTRY[key]
 
+    # Imported here so that argparse-only invocations (--help, bad args)
+    # never pay the transformers import cost
+    from transformers import AutoConfig, AutoProcessor
+
     processor = AutoProcessor.from_pretrained(model_id)
     config = AutoConfig.from_pretrained(model_id) if needs_config else None
 
@@ -1,12 +1,11 @@
+from functools import lru_cache, partial
 from typing import Tuple
 
 from .tools import (
     resize_and_grid,
     get_optimal_tiled_canvas,
     select_best_resolution,
-    get_patch_output_size,
-    get_padding_size,
-    get_unpadded_features,
+    get_anyres_features,
 )
 
 
@@ -28,11 +27,11 @@ class VLMAnalyst:
 
 
 class LLaVAAnalyst(VLMAnalyst):
+    image_token: str = "<image>"
+
     def __init__(self, processor):
         super().__init__(processor)
 
-        self.image_token: str = "<image>"
-
         self.resized_height, self.resized_width = (
             processor.image_processor.crop_size["height"],
             processor.image_processor.crop_size["width"],
@@ -64,11 +63,11 @@ class LLaVAAnalyst(VLMAnalyst):
 
 
 class LLaVANextAnalyst(VLMAnalyst):
+    image_token: str = "<image>"
+
     def __init__(self, processor):
         super().__init__(processor)
 
-        self.image_token: str = "<image>"
-
         size = processor.image_processor.size
         self.tile_size = (
             (size["shortest_edge"], size["shortest_edge"])
@@ -80,7 +79,11 @@ class LLaVANextAnalyst(VLMAnalyst):
         )  # (336, 336)
 
         self.patch_size = processor.patch_size
-        self.grid_pinpoints = processor.image_processor.image_grid_pinpoints
+        # Stored as a tuple of tuples so select_best_resolution can cache on it
+        self.grid_pinpoints = tuple(
+            tuple(pinpoint)
+            for pinpoint in processor.image_processor.image_grid_pinpoints
+        )
         self.num_additional_image_tokens = (
             processor.num_additional_image_tokens
         )  # such as CLS (+1)
@@ -88,41 +91,17 @@ class LLaVANextAnalyst(VLMAnalyst):
 
     def calculate(self, image_size: Tuple[int, int]) -> dict:
         best_resolution = select_best_resolution(image_size, self.grid_pinpoints)
-        resized_height, resized_width = get_patch_output_size(
-            image_size, best_resolution
-        )
-        padding_y, padding_x = get_padding_size(
-            (resized_height, resized_width), best_resolution
+        (
+            resized_size,
+            num_patches,
+            base_patches,
+            unpadded_features,
+            newline_features,
+        ) = get_anyres_features(
+            image_size, best_resolution, self.tile_size, self.patch_size
         )
 
-        num_patches = (
-            best_resolution[0]
-            // self.tile_size[0]
-            * best_resolution[1]
-            // self.tile_size[1]
-            + 1  # global patch
-        )
-
-        scale_height, scale_width = (
-            best_resolution[0] // self.tile_size[0],
-            best_resolution[1] // self.tile_size[1],
-        )
-
-        patches_height = self.tile_size[0] // self.patch_size
-        patches_width = self.tile_size[1] // self.patch_size
-
-        unpadded_features, newline_features = get_unpadded_features(
-            image_size[0],
-            image_size[1],
-            patches_height,
-            patches_width,
-            scale_height,
-            scale_width,
-        )
-
-        base_features = (
-            patches_height * patches_width + self.num_additional_image_tokens
-        )
+        base_features = base_patches + self.num_additional_image_tokens
         num_image_tokens = unpadded_features + newline_features + base_features
 
         if self.vision_feature_select_strategy == "default":
@@ -133,18 +112,18 @@ class LLaVANextAnalyst(VLMAnalyst):
             "patch_size": self.patch_size,
             "has_global_patch": False,
             "image_size": image_size,
-            "resized_size": (resized_height, resized_width),
+            "resized_size": resized_size,
             "image_token": (self.image_token, num_image_tokens),
             "image_token_format": f"{self.image_token}*{num_image_tokens}",
         }
 
 
 class LlavaOnevisionAnalyst(VLMAnalyst):
+    image_token: str = "<image>"
+
     def __init__(self, processor, config):
         super().__init__(processor)
 
-        self.image_token: str = "<image>"
-
         size = processor.image_processor.size
         self.tile_size = (
             (size["shortest_edge"], size["shortest_edge"])
@@ -156,47 +135,32 @@ class LlavaOnevisionAnalyst(VLMAnalyst):
         )  # (384, 384)
 
         self.patch_size = config.vision_config.patch_size
-        self.grid_pinpoints = processor.image_processor.image_grid_pinpoints
+        # Stored as a tuple of tuples so select_best_resolution can cache on it
+        self.grid_pinpoints = tuple(
+            tuple(pinpoint)
+            for pinpoint in processor.image_processor.image_grid_pinpoints
+        )
         self.vision_feature_select_strategy = processor.vision_feature_select_strategy
         self.max_num_patches = int(processor.vision_aspect_ratio.strip("anyres_max_"))
 
     def calculate(self, image_size: Tuple[int, int]) -> dict:
         best_resolution = select_best_resolution(image_size, self.grid_pinpoints)
-        resized_height, resized_width = get_patch_output_size(
-            image_size, best_resolution
-        )
-        padding_y, padding_x = get_padding_size(
-            (resized_height, resized_width), best_resolution
-        )
-
-        num_patches = (
-            best_resolution[0]
-            // self.tile_size[0]
-            * best_resolution[1]
-            // self.tile_size[1]
-            + 1  # global patch
-        )
-
-        scale_height, scale_width = (
-            best_resolution[0] // self.tile_size[0],
-            best_resolution[1] // self.tile_size[1],
-        )
-
-        patches_height = self.tile_size[0] // self.patch_size
-        patches_width = self.tile_size[1] // self.patch_size
-
-        unpadded_features, newline_features = get_unpadded_features(
-            image_size[0],
-            image_size[1],
-            patches_height,
-            patches_width,
-            scale_height,
-            scale_width,
+        (
+            resized_size,
+            num_patches,
+            base_patches,
+            unpadded_features,
+            newline_features,
+        ) = get_anyres_features(
+            image_size,
+            best_resolution,
+            self.tile_size,
+            self.patch_size,
             max_num_patches=self.max_num_patches,
         )
 
         # The base patch covers the entire image (no CLS for SigLIP)
-        base_features = patches_height * patches_width
+        base_features = base_patches
         num_image_tokens = unpadded_features + newline_features + base_features
 
         if self.vision_feature_select_strategy == "default":
@@ -207,20 +171,20 @@ class LlavaOnevisionAnalyst(VLMAnalyst):
             "patch_size": self.patch_size,
             "has_global_patch": False,
             "image_size": image_size,
-            "resized_size": (resized_height, resized_width),
+            "resized_size": resized_size,
             "image_token": (self.image_token, num_image_tokens),
             "image_token_format": f"{self.image_token}*{num_image_tokens}",
         }
 
 
 class Qwen2VLAnalyst(VLMAnalyst):
+    image_token: str = "<|image_pad|>"
+    image_start_token: str = "<|vision_start|>"
+    image_end_token: str = "<|vision_end|>"
+
     def __init__(self, processor):
         super().__init__(processor)
 
-        self.image_token: str = "<|image_pad|>"
-        self.image_start_token: str = "<|vision_start|>"
-        self.image_end_token: str = "<|vision_end|>"
-
         self.patch_size = processor.image_processor.patch_size
         self.merge_size = processor.image_processor.merge_size
         self.min_pixels = (
@@ -232,18 +196,32 @@ class Qwen2VLAnalyst(VLMAnalyst):
             or processor.image_processor.size["longest_edge"]
         )
 
-    def calculate(self, image_size: Tuple[int, int]) -> dict:
-        resized_h, resized_w, grid_h, grid_w = resize_and_grid(
-            image_size,
-            self.patch_size,
-            self.merge_size,
-            self.min_pixels,
-            self.max_pixels,
+        self._merge_sq = self.merge_size * self.merge_size
+
+        # Only the token count varies per image, so keep a printf-style
+        # template instead of rebuilding the whole f-string each call
+        self._token_format_template = (
+            f"{self.image_start_token}{self.image_token}*%d{self.image_end_token}"
         )
+
+        # Bind the model constants once so the cache is keyed on image_size
+        # alone instead of hashing a 5-tuple on every call
+        self._resize_and_grid = lru_cache(maxsize=1024)(
+            partial(
+                resize_and_grid,
+                patch_size=self.patch_size,
+                merge_size=self.merge_size,
+                min_pixels=self.min_pixels,
+                max_pixels=self.max_pixels,
+            )
+        )
+
+    def calculate(self, image_size: Tuple[int, int]) -> dict:
+        resized_h, resized_w, grid_h, grid_w = self._resize_and_grid(image_size)
         num_patches = grid_h * grid_w
 
         # Qwen2-VL: merged tokens = patches / (merge_size^2)
-        num_tokens = num_patches // (self.merge_size**2)
+        num_tokens = num_patches // self._merge_sq
 
         return {
             "number_of_image_patches": num_patches,
@@ -255,7 +233,7 @@ class Qwen2VLAnalyst(VLMAnalyst):
             "image_token": (self.image_token, num_tokens),
             "image_start_token": (self.image_start_token, 1),
             "image_end_token": (self.image_end_token, 1),
-            "image_token_format": f"{self.image_start_token}{self.image_token}*{num_tokens}{self.image_end_token}",
+            "image_token_format": self._token_format_template % num_tokens,
         }
 
 
@@ -268,13 +246,13 @@ class Qwen3VLAnalyst(Qwen2VLAnalyst):
 
 
 class InternVLAnalyst(VLMAnalyst):
+    image_token: str = "<IMG_CONTEXT>"
+    image_start_token: str = "<img>"
+    image_end_token: str = "</img>"
+
     def __init__(self, processor, config):
         super().__init__(processor)
 
-        self.image_token: str = "<IMG_CONTEXT>"
-        self.image_start_token: str = "<img>"
-        self.image_end_token: str = "</img>"
-
         self.min_patches = processor.image_processor.min_patches
         self.max_patches = processor.image_processor.max_patches
         assert (
@@ -291,6 +269,15 @@ class InternVLAnalyst(VLMAnalyst):
             self.tile_size // self.patch_size // self.pixel_unshuffle_size
         ) ** 2
 
+        # The displayed format only depends on image_seq_length, so it is
+        # fully constant per instance
+        self._token_format = (
+            f"{self.image_start_token}"
+            f"{self.image_token}*{self.image_seq_length}"
+            f"{self.image_token}*{self.image_seq_length}..."
+            f"{self.image_end_token}"
+        )
+
     def calculate(self, image_size: Tuple[int, int]) -> dict:
         num_patches = 1
         grid_w, grid_h = get_optimal_tiled_canvas(
@@ -299,8 +286,9 @@ class InternVLAnalyst(VLMAnalyst):
             self.min_patches,
             self.max_patches,
         )
-        if grid_w * grid_h > 1:
-            num_patches += grid_h * grid_w
+        grid_patches = grid_h * grid_w
+        if grid_patches > 1:
+            num_patches += grid_patches
 
         num_tokens = num_patches * self.image_seq_length
 
@@ -315,5 +303,5 @@ class InternVLAnalyst(VLMAnalyst):
             "image_token": (self.image_token, num_tokens),
             "image_start_token": (self.image_start_token, 1),
             "image_end_token": (self.image_end_token, 1),
-            "image_token_format": f"{self.image_start_token}{self.image_token}*{self.image_seq_length}{self.image_token}*{self.image_seq_length}...{self.image_end_token}",
+            "image_token_format": self._token_format,
         }
@@ -3,7 +3,8 @@ from typing import Tuple
 import math
 
 
-def select_best_resolution(original_size: tuple, possible_resolutions: list) -> tuple:
+@lru_cache(maxsize=1024)
+def select_best_resolution(original_size: tuple, possible_resolutions: tuple) -> tuple:
     """
     Selects the best resolution from a list of possible resolutions based on the original size.
 
@@ -14,8 +15,9 @@ def select_best_resolution(original_size: tuple, possible_resolutions: list) ->
     Args:
         original_size (tuple):
             The original size of the image in the format (height, width).
-        possible_resolutions (list):
-            A list of possible resolutions in the format [(height1, width1), (height2, width2), ...].
+        possible_resolutions (tuple):
+            Possible resolutions in the format ((height1, width1), (height2, width2), ...).
+            Must be a tuple of tuples so the result can be cached.
 
     Returns:
         tuple: The best fit resolution in the format (height, width).
@@ -111,7 +113,62 @@ def get_unpadded_features(
     return (unpadded_features, newline_features)
 
 
-@lru_cache(maxsize=10)
+def get_anyres_features(
+    image_size,
+    best_resolution,
+    tile_size,
+    patch_size,
+    max_num_patches=None,
+):
+    """
+    Fused helper for the anyres (LLaVA-NeXT style) feature computation.
+
+    Combines get_patch_output_size and get_unpadded_features into a single
+    call so the tile grid is derived once and shared between the patch count
+    and the unpadded-feature math.
+
+    Args:
+        image_size (tuple): Original image size in (height, width) format.
+        best_resolution (tuple): Canvas chosen by select_best_resolution.
+        tile_size (tuple): Tile size in (height, width) format.
+        patch_size (int): ViT patch size.
+        max_num_patches (int, optional): Tile cap from the model's
+            "anyres_max_N" vision aspect ratio, if any.
+
+    Returns:
+        tuple: (resized_size, num_patches, base_patches, unpadded_features,
+        newline_features) where resized_size is (height, width) and
+        base_patches is the per-tile patch count.
+    """
+    resized_height, resized_width = get_patch_output_size(image_size, best_resolution)
+
+    scale_height = best_resolution[0] // tile_size[0]
+    scale_width = best_resolution[1] // tile_size[1]
+    num_patches = scale_height * scale_width + 1  # global patch
+
+    patches_height = tile_size[0] // patch_size
+    patches_width = tile_size[1] // patch_size
+
+    unpadded_features, newline_features = get_unpadded_features(
+        image_size[0],
+        image_size[1],
+        patches_height,
+        patches_width,
+        scale_height,
+        scale_width,
+        max_num_patches=max_num_patches,
+    )
+
+    return (
+        (resized_height, resized_width),
+        num_patches,
+        patches_height * patches_width,
+        unpadded_features,
+        newline_features,
+    )
+
+
+@lru_cache(maxsize=32)
 def get_all_supported_aspect_ratios(
     min_image_tiles: int, max_image_tiles: int
 ) -> list[tuple[int, int]]:
@@ -148,7 +205,7 @@ def get_all_supported_aspect_ratios(
     return aspect_ratios
 
 
-@lru_cache(maxsize=100)
+@lru_cache(maxsize=1024)
 def get_optimal_tiled_canvas(
     original_image_size: tuple[int, int],
     target_tile_size: tuple[int, int],
@@ -185,6 +242,11 @@ def get_optimal_tiled_canvas(
             # until the area covered by the patches is more than twice the original image area
             if area > 0.5 * target_tile_height * target_tile_width * grid[0] * grid[1]:
                 best_grid = grid
+            elif best_ratio_diff == 0:
+                # arrangements are sorted by tile count, so once an exact
+                # aspect match fails the area rule every later candidate
+                # (same ratio, more tiles) fails it too
+                break
 
     return best_grid
 
@@ -213,7 +275,9 @@ def smart_resize(
     3. The aspect ratio of the image is maintained as closely as possible.
 
     """
-    if max(height, width) / min(height, width) > 200:
+    # Integer form of max/min > 200: no float division on the success path,
+    # and the ratio is only formatted when the check actually fails
+    if max(height, width) > 200 * min(height, width):
         raise ValueError(
             f"absolute aspect ratio must be smaller than 200, got {max(height, width) / min(height, width)}"
         )
@@ -230,7 +294,6 @@ def smart_resize(
     return h_bar, w_bar
 
 
-@lru_cache(maxsize=1024)
 def resize_and_grid(
     image_size: Tuple[int, int],
     patch_size: int,
@@ -238,6 +301,20 @@ def resize_and_grid(
     min_pixels: int,
     max_pixels: int,
 ):
+    """Resize an image size to the patch grid used by the Qwen-VL models.
+
+    Args:
+        image_size (Tuple[int, int]): Image size in (height, width) format.
+            Note the ordering: PIL's Image.size is (width, height), so callers
+            holding a PIL size must swap before calling.
+        patch_size (int): ViT patch size.
+        merge_size (int): Spatial merge size.
+        min_pixels (int): Lower bound on the resized pixel count.
+        max_pixels (int): Upper bound on the resized pixel count.
+
+    Returns:
+        tuple: (resized_height, resized_width, grid_height, grid_width).
+    """
     height, width = image_size
     factor = patch_size * merge_size
     resized_h, resized_w = smart_resize(height, width, factor, min_pixels, max_pixels)
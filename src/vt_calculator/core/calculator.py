@@ -1,13 +1,13 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from ..setup_env import setup_quiet_environment
 
 from PIL import Image
-from ..utils import get_image_files, calculate_mean, calculate_stdev, create_dummy_image
+from ..utils import get_image_files, calculate_mean, calculate_stdev
 from ..parser import parse_arguments
 from ..reporter import (
     display_batch_results,
-    print_processing_status,
     print_processing_result,
     print_directory_info,
 )
@@ -18,40 +18,48 @@ from ..analysts import load_analyst, DEFAULT_MODEL
 setup_quiet_environment()
 
 
-def count_image_tokens(image_input, model_name: str = DEFAULT_MODEL):
+def count_image_tokens(image_input, model_name: str = DEFAULT_MODEL, analyst=None):
     """
     Calculate the number of image tokens generated when processing an image.
 
     Args:
-        image_input: Either a file path (str) or PIL Image object
+        image_input: A file path (str), a PIL Image object, or an
+            (height, width) tuple when only the dimensions are known
         model_name (str): Short model name to use for processing
+        analyst: Optional pre-built analyst instance. When processing many
+            images (e.g. a directory), build the analyst once and pass it in
+            to avoid reloading the processor per image.
 
     Returns:
         dict: Dictionary containing token counts and details
     """
 
     # Build analyst via factory (handles aliases and config requirements)
-    analyst = load_analyst(model_name)
-
-    if isinstance(image_input, str):
-        image_input = Image.open(image_input)
-
-    # PIL.Image.size -> (width, height); analyst expects (height, width)
-    width, height = image_input.size
+    if analyst is None:
+        analyst = load_analyst(model_name)
+
+    if isinstance(image_input, tuple):
+        # Size-only input, e.g. the --size CLI path; no image is ever built
+        height, width = image_input
+    elif isinstance(image_input, str):
+        # Image.open only parses the header, so reading .size never decodes
+        # pixel data; the context manager releases the file handle right away
+        with Image.open(image_input) as image:
+            width, height = image.size
+    else:
+        # PIL.Image.size -> (width, height); analyst expects (height, width)
+        width, height = image_input.size
     result = analyst.calculate((height, width))
 
-    # Backward-compatible total token count for batch statistics
-    if (
-        isinstance(result.get("image_token"), (list, tuple))
-        and isinstance(result.get("image_start_token"), (list, tuple))
-        and isinstance(result.get("image_end_token"), (list, tuple))
-    ):
-        total_tokens = (
-            int(result["image_token"][1])
-            + int(result["image_start_token"][1])
-            + int(result["image_end_token"][1])
-        )
-        result["number_of_image_tokens"] = total_tokens
+    # Analysts always emit "image_token" as a (symbol, count) pair and only
+    # some families add start/end wrappers; normalize the total here so
+    # downstream consumers never have to re-check shapes
+    total_tokens = int(result["image_token"][1])
+    for key in ("image_start_token", "image_end_token"):
+        wrapper = result.get(key)
+        if wrapper is not None:
+            total_tokens += int(wrapper[1])
+    result["number_of_image_tokens"] = total_tokens
 
     return result
 
@@ -75,21 +83,37 @@ def process_directory(directory_path: str, model_name: str):
 
     print_directory_info(directory_path, len(image_files))
 
+    # Load the analyst once; it is invariant across images
+    analyst = load_analyst(model_name)
+
     token_counts = []
     processed_files = []
 
-    # Process each image
-    for i, image_file in enumerate(image_files, 1):
-        filename = os.path.basename(image_file)
-        print_processing_status(filename, i, len(image_files))
-
-        result = count_image_tokens(image_file, model_name)
-        token_count = int(result["number_of_image_tokens"])
-        token_counts.append(token_count)
-        processed_files.append(
-            {"filename": filename, "size": result["image_size"], "tokens": token_count}
+    # Each image is independent, so overlap the header reads across a thread
+    # pool; executor.map yields results in input order, keeping the progress
+    # output stable
+    max_workers = min(len(image_files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda image_file: count_image_tokens(
+                image_file, model_name, analyst=analyst
+            ),
+            image_files,
         )
-        print_processing_result(True, token_count)
+
+        for i, (image_file, result) in enumerate(zip(image_files, results), 1):
+            filename = os.path.basename(image_file)
+
+            token_count = int(result["number_of_image_tokens"])
+            token_counts.append(token_count)
+            processed_files.append(
+                {
+                    "filename": filename,
+                    "size": result["image_size"],
+                    "tokens": token_count,
+                }
+            )
+            print_processing_result(filename, i, len(image_files), token_count)
 
     # Calculate statistics
     stats = {
@@ -112,29 +136,27 @@ def main():
     """
     args = parse_arguments()
 
-    if args.image:
-        if os.path.isdir(args.image):
-            stats = process_directory(args.image, args.model_name)
-            display_batch_results(stats, args.model_name)
-        else:
-            print(f"Using existing image: {args.image}")
-
-            result = count_image_tokens(args.image, args.model_name)
-
-            reporter = Reporter()
-            reporter.print(result, args.model_name, f"{args.image}")
+    if args.image and os.path.isdir(args.image):
+        stats = process_directory(args.image, args.model_name)
+        display_batch_results(stats, args.model_name)
+        return
 
-    elif args.size:
+    if args.image:
+        print(f"Using existing image: {args.image}")
+        image_input = args.image
+        image_source = args.image
+    else:
         height, width = args.size
-        image_input = create_dummy_image(height, width)
         print(f"Using dummy image: {height} x {width}")
+        # Only the dimensions matter, so skip allocating a dummy image
+        image_input = (height, width)
+        image_source = "Dummy image"
 
-        # Calculate tokens
-        result = count_image_tokens(image_input, args.model_name)
+    result = count_image_tokens(image_input, args.model_name)
 
-        # Display results using Reporter
-        reporter = Reporter()
-        reporter.print(result, args.model_name, "Dummy image")
+    # Display results using Reporter
+    reporter = Reporter()
+    reporter.print(result, args.model_name, image_source)
 
 
 
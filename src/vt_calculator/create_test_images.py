@@ -22,7 +22,9 @@ def create_test_image(width, height, filename, color=None):
         )
 
     image = Image.new("RGB", (width, height), color)
-    image.save(filename)
+    # Fixtures are solid colors; a moderate quality keeps encode fast and
+    # the files small without affecting the dimensions under test
+    image.save(filename, quality=75, optimize=False)
     print(f"Created: {filename}")
 
 
@@ -3,7 +3,10 @@ import argparse
 from .analysts import SUPPORTED_MODELS, DEFAULT_MODEL
 
 
-def parse_arguments():
+_PARSER = None
+
+
+def _build_parser():
     parser = argparse.ArgumentParser(description="Vision Token Calculator")
 
     input_group = parser.add_mutually_exclusive_group(required=True)
@@ -30,4 +33,19 @@ def parse_arguments():
         help=f"Short model name to use (default: {DEFAULT_MODEL})",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv=None):
+    """Parse CLI arguments, reusing one parser across in-process calls.
+
+    Args:
+        argv: Optional argument list; defaults to sys.argv like argparse.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER.parse_args(argv)
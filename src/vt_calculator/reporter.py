@@ -6,8 +6,6 @@ from rich import box
 
 console = Console()
 
-SEPARATOR = "=" * 72
-
 
 def display_batch_results(stats: dict, model_name: str):
     """
@@ -40,23 +38,28 @@ def display_batch_results(stats: dict, model_name: str):
             console.print(f"  - {failed['filename']}: {failed['error']}")
 
 
-def print_processing_status(filename: str, current: int, total: int):
+def print_processing_result(
+    filename: str, current: int, total: int, token_count: int = None, error: str = None
+):
     """
-    Print processing status for batch operations.
+    Print the processing result for one file in a batch operation.
+
+    Status and result are emitted as a single line, halving the console
+    writes per file compared to a separate status/result pair.
 
     Args:
-        filename (str): Name of file being processed
+        filename (str): Name of the processed file
         current (int): Current file number
         total (int): Total number of files
+        token_count (int): Token count on success
+        error (str): Error message on failure
     """
-    console.print(f"[{current}/{total}] Processing: {filename} ", end="")
-
-
-def print_processing_result(success: bool, token_count: int = None, error: str = None):
-    if success:
-        console.print(f"[green]✓ ({token_count} tokens)[/green]")
+    if error is None:
+        console.print(
+            f"[{current}/{total}] {filename} [green]✓ ({token_count} tokens)[/green]"
+        )
     else:
-        console.print(f"[red]✗ (Error: {error})[/red]")
+        console.print(f"[{current}/{total}] {filename} [red]✗ (Error: {error})[/red]")
 
 
 def print_directory_info(directory_path: str, file_count: int):
@@ -68,6 +71,14 @@ def print_directory_info(directory_path: str, file_count: int):
 class Reporter:
     """Reporter for displaying single-image analysis results."""
 
+    # Result keys with their display labels, derived once instead of
+    # re-title-casing the key strings on every report
+    _TOKEN_ROWS = (
+        ("image_token", "Image Token"),
+        ("image_start_token", "Image Start Token"),
+        ("image_end_token", "Image End Token"),
+    )
+
     def __init__(self, label_width: int = 42):
         self.label_width = label_width
 
@@ -161,11 +172,12 @@ class Reporter:
 
         # Prepare token info items
         items_to_show = []
-        for key in ["image_token", "image_start_token", "image_end_token"]:
+        for key, display_label in self._TOKEN_ROWS:
             value = result.get(key)
-            if isinstance(value, (list, tuple)) and len(value) == 2:
+            # Analysts always emit (symbol, count) pairs, so presence is
+            # the only thing left to check
+            if value is not None:
                 token_symbol, token_count = value
-                display_label = key.replace("_", " ").title()
                 display_name = f"{display_label} ({token_symbol})"
                 items_to_show.append((display_name, token_count))
 
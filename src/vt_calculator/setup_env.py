@@ -1,7 +1,16 @@
 import warnings
 
+_configured = False
+
 
 def setup_quiet_environment():
+    # Importing modules repeatedly (tests, batch workers) calls this more
+    # than once; the filters and logger tweaks only need to run a single time
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
     warnings.filterwarnings("ignore")
 
     try:
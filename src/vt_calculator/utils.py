@@ -1,11 +1,13 @@
 import os
-import glob
+from statistics import fmean, stdev
 from typing import Iterable
-import numpy as np
 
 from PIL import Image
 
 
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+
 def get_image_files(directory_path: str):
     """
     Get all image files from the specified directory.
@@ -16,34 +18,34 @@ def get_image_files(directory_path: str):
     Returns:
         list: List of image file paths
     """
-    image_extensions = [
-        "*.jpg",
-        "*.jpeg",
-        "*.png",
-        "*.webp",
-    ]
-    image_files = []
+    # One scandir pass with a case-insensitive suffix check replaces the old
+    # per-extension glob calls (each of which rescanned the directory) and
+    # also catches mixed-case names like .JpG
+    with os.scandir(directory_path) as entries:
+        image_files = [
+            entry.path
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
 
-    for ext in image_extensions:
-        for case_ext in [ext, ext.upper()]:
-            pattern = os.path.join(directory_path, case_ext)
-            image_files += glob.glob(pattern)
-
-    return sorted(image_files)
+    # Case-insensitive ordering keeps results stable across filesystems
+    return sorted(image_files, key=str.lower)
 
 
 def calculate_mean(values: Iterable[float]) -> float:
-    arr = np.array(values, dtype=float)
-    if arr.size == 0:
+    vals = list(values)
+    if not vals:
         return 0.0
-    return float(arr.mean())
+    return float(fmean(vals))
 
 
 def calculate_stdev(values: Iterable[float]) -> float:
-    arr = np.array(values, dtype=float)
-    if arr.size < 2:
+    # statistics.stdev is the sample deviation, matching the previous
+    # numpy std(ddof=1) semantics
+    vals = list(values)
+    if len(vals) < 2:
         return 0.0
-    return float(arr.std(ddof=1))
+    return float(stdev(vals))
 
 
 def create_dummy_image(height: int, width: int):
@@ -57,11 +59,9 @@ def create_dummy_image(height: int, width: int):
     Returns:
         PIL.Image.Image: PIL Image object
     """
-    # Create a simple black image using np.zeros
-    image_array = np.zeros((height, width, 3), dtype=np.uint8)
-    image = Image.fromarray(image_array)
-
-    return image
+    # Image.new fills a single PIL-owned buffer in C, avoiding the
+    # numpy-array-then-copy round-trip of Image.fromarray
+    return Image.new("RGB", (width, height), (0, 0, 0))
 
 
 def check_transformers_version():
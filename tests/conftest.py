@@ -0,0 +1,25 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def hf_assets():
+    """Session-scoped loader caching processors/configs per model path.
+
+    Loading a processor re-parses tokenizer and config JSON (and may download
+    on a cold cache), so share one instance per model across the whole test
+    session instead of reloading in every test.
+    """
+    from transformers import AutoConfig, AutoProcessor
+
+    cache = {}
+
+    def load(model_path, needs_config=False):
+        processor, config = cache.get(model_path, (None, None))
+        if processor is None:
+            processor = AutoProcessor.from_pretrained(model_path)
+        if needs_config and config is None:
+            config = AutoConfig.from_pretrained(model_path)
+        cache[model_path] = (processor, config)
+        return processor, config
+
+    return load
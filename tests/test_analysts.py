@@ -1,6 +1,5 @@
 import torch
 import pytest
-from transformers import AutoProcessor, AutoConfig
 
 from vt_calculator.utils import create_dummy_image
 from vt_calculator.analysts.analyst import (
@@ -47,12 +46,7 @@ def _count_tokens_via_processor(processor, pil_image) -> int:
         raise ValueError("Image token not found in processor")
 
     input_ids = inputs["input_ids"]
-    num_image_tokens_tensor = (input_ids[0] == image_token_index).sum()
-    return int(
-        num_image_tokens_tensor.item()
-        if isinstance(num_image_tokens_tensor, torch.Tensor)
-        else num_image_tokens_tensor
-    )
+    return int(torch.count_nonzero(input_ids[0] == image_token_index))
 
 
 def _get_processor_image_token_str(processor) -> str:
@@ -125,15 +119,14 @@ def _assert_token_count_matches(counted_tokens: int, analyst_tokens: int) -> Non
     ],
 )
 def test_analyst_token_count_matches_transformers(
-    model_path, analyst_factory, image_size, needs_config
+    model_path, analyst_factory, image_size, needs_config, hf_assets
 ):
     """Parametrized test verifying analyst matches processor token behavior."""
     # Create a small deterministic image (image_size is (H, W))
     image = create_dummy_image(width=image_size[1], height=image_size[0])
 
-    # Load the real processor (may download configs on first run)
-    processor = AutoProcessor.from_pretrained(model_path)
-    config = AutoConfig.from_pretrained(model_path) if needs_config else None
+    # Load the real processor once per session (may download on first run)
+    processor, config = hf_assets(model_path, needs_config)
 
     # Count tokens via processor outputs
     counted_tokens = _count_tokens_via_processor(processor, image)